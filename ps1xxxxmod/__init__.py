@@ -4,6 +4,6 @@ PS1XXXXMOD Package
 This package provides a Python interface to communicate with PS1-*.*-MOD series gas sensors.
 """
 
-from .core import PS1XXXXMOD
+from .core import PS1XXXXMOD, InvalidChecksum, InvalidValue, NoResponse
 
-__all__ = ["PS1XXXXMOD"]
+__all__ = ["PS1XXXXMOD", "InvalidChecksum", "InvalidValue", "NoResponse"]
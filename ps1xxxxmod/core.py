@@ -1,6 +1,116 @@
+import functools
+import itertools
+import math
+import os
+import queue
+import random
+import select
 import serial
+import struct
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Response layouts, decoded in a single call; multi-byte fields are big-endian.
+# Measurement frame: start, command, gas concentration 1, full range, gas concentration 2, checksum
+_FRAME9 = struct.Struct(">BBHHHB")
+# Read-all frame: as above, plus temperature and humidity (both x100) before the checksum
+_FRAME13 = struct.Struct(">BBHHHHHB")
+# Sensor information (0xD1): type, maximum range, unit, 3 reserved, decimals/sign, checksum
+_SENSOR_INFO = struct.Struct(">BHB3xBB")
+# Sensor information (0xD7): 2 header, type, maximum range, unit, decimals/sign, reserved, checksum
+_SENSOR_INFO_2 = struct.Struct(">2xBHBBxB")
+
+# Measurement units by unit byte
+_UNIT_TABLE = {
+    0x02: ("ppm", "mg/m³"),
+    0x04: ("ppb", "µg/m³"),
+    0x08: ("10g/m³", "%"),
+}
+
+# Two-digit upper-case hexadecimal representation of every byte value
+_HEX = tuple("{:02X}".format(i) for i in range(256))
+
+# Characters accepted by `bytes.fromhex`, whitespace included
+_HEX_CHARACTERS = "0123456789abcdefABCDEF \t\n\r\v\f"
+
+
+def _build_frame(command: int, payload: int = 0x00) -> bytes:
+    """
+    Builds a complete 9-byte command frame, checksum included.
+
+    Parameters:
+        command (int): Command byte.
+        payload (int, optional): Payload byte. Default is 0x00.
+
+    Returns:
+        bytes: Command frame ready to be written to the sensor.
+    """
+    frame = bytes((0xFF, 0x01, command, payload, 0x00, 0x00, 0x00, 0x00))
+    return frame + bytes((-sum(frame[1:]) & 0xFF,))
+
+
+def _import_numpy() -> Any:
+    """
+    Imports NumPy on first use, so that importing this package does not pay for it.
+
+    Returns:
+        module: The `numpy` module.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for batch processing: pip install PY-PS1XXXXMOD[numpy]"
+        ) from None
+    return numpy
+
+
+class InvalidValue(Exception):
+    """
+    Exception raised when an invalid value is provided.
+    """
+
+    pass
+
+
+class InvalidChecksum(Exception):
+    """
+    Exception raised when the response checksum does not match.
+    """
+
+    pass
+
+
+class NoResponse(Exception):
+    """
+    Exception raised when no response is received from the sensor.
+    """
+
+    pass
+
+
+@functools.lru_cache(maxsize=1024)
+def _frame_to_hex(data: bytes) -> str:
+    """
+    Formats a frame as space-separated hexadecimal bytes.
+
+    Cached, since the sensor often sends the same frame several times in a row.
+
+    Parameters:
+        data (bytes): Frame to format.
+
+    Returns:
+        str: Hexadecimal representation of the frame, e.g. "FF 86 00 2A".
+    """
+    return " ".join([_HEX[byte] for byte in data])
 
 
 class PS1XXXXMOD:
@@ -12,8 +122,26 @@ class PS1XXXXMOD:
 
     Attributes:
         ser (serial.Serial): Serial object for serial communication.
+        timeout (float | None): Time budget, in seconds, for reading a response (None: no limit).
+        backoff_base (float): Delay, in seconds, before the first retry of a command.
+        max_backoff (float): Upper bound, in seconds, of the delay between retries.
+        strict_checksum (bool): Whether a response with an invalid checksum raises InvalidChecksum.
+        checksum_errors (int): Number of responses and streamed frames rejected because of an
+            invalid checksum.
     """
 
+    # Timeout of a single low-level read; reads are repeated until the overall deadline
+    _READ_SLICE = 0.05
+
+    # Fixed command frames, built once instead of on every call
+    _CMD_SET_ACTIVE = _build_frame(0x78, 0x40)
+    _CMD_SET_PASSIVE = _build_frame(0x78, 0x41)
+    _CMD_GAS_CONCENTRATION = _build_frame(0x86)
+    _CMD_READ_ALL = _build_frame(0x87)
+    _CMD_LIGHT_OFF = _build_frame(0x88)
+    _CMD_LIGHT_ON = _build_frame(0x89)
+    _CMD_LIGHT_STATUS = _build_frame(0x8A)
+
     def __init__(
         self,
         port: str,
@@ -21,7 +149,11 @@ class PS1XXXXMOD:
         bytesize: int = serial.EIGHTBITS,
         stopbits: int = serial.STOPBITS_ONE,
         parity: str = serial.PARITY_NONE,
-        timeout: float = 1.0,
+        timeout: Optional[float] = 1.0,
+        backoff_base: float = 0.05,
+        max_backoff: float = 1.0,
+        low_latency: bool = False,
+        strict_checksum: bool = False,
     ) -> None:
         """
         Initializes the serial connection with the sensor.
@@ -32,8 +164,22 @@ class PS1XXXXMOD:
             bytesize (int, optional): Number of bits per byte. Default is serial.EIGHTBITS.
             stopbits (int, optional): Number of stop bits. Default is serial.STOPBITS_ONE.
             parity (str, optional): Parity. Default is serial.PARITY_NONE.
-            timeout (float, optional): Timeout for read operations. Default is 1.0 seconds.
+            timeout (float | None, optional): Time allowed for each response to arrive; None waits
+                indefinitely. Default is 1.0 seconds.
+            backoff_base (float, optional): Delay before the first retry, doubled on each further retry. Default is 0.05 seconds.
+            max_backoff (float, optional): Maximum delay between retries. Default is 1.0 seconds.
+            low_latency (bool, optional): On POSIX systems, read the port's file descriptor directly
+                with `select` and `os.read`, bypassing pySerial's read path. Default is False.
+            strict_checksum (bool, optional): Raise InvalidChecksum on a response with an invalid
+                checksum instead of returning None (or False). Default is False.
+
+        Raises:
+            InvalidValue: If `timeout` is not greater than 0.
         """
+        if timeout is not None and timeout <= 0:
+            raise InvalidValue(
+                "Timeout must be greater than 0, or None to wait indefinitely"
+            )
         self.ser = serial.Serial(
             port=port,
             baudrate=baudrate,
@@ -42,7 +188,62 @@ class PS1XXXXMOD:
             parity=parity,
             timeout=timeout,  # Timeout to prevent blocking
         )
-        self.ser.timeout = timeout
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.strict_checksum = strict_checksum
+        # pySerial still configures the port and handles writes
+        self._fd: Optional[int] = (
+            self.ser.fileno() if low_latency and os.name == "posix" else None
+        )
+        self._sensor_info_cache: Optional[Dict[str, Any]] = None
+        self._stream_queue: Optional[queue.Queue] = None
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_stop = threading.Event()
+        self._stream_error: Optional[Exception] = None
+        self.checksum_errors = 0
+        # Short reads return promptly so that `_read_exactly` can track its own deadline
+        self.ser.timeout = (
+            self._READ_SLICE if timeout is None else min(timeout, self._READ_SLICE)
+        )
+        self._tune_port(port)
+
+    def _tune_port(self, port: str) -> None:
+        """
+        Tunes the serial port for short response times (best effort).
+
+        - Linux: sets the ASYNC_LOW_LATENCY flag of the tty, and lowers the latency timer
+          of FTDI USB-serial adapters to 1 ms. FTDI chips otherwise hold received bytes
+          for up to 16 ms before passing them to the host, adding that delay to every
+          response.
+        - Windows: enlarges the driver buffers, so streamed frames are not dropped while
+          the application is busy.
+
+        Settings the platform or driver does not support, or that require more permissions,
+        are silently skipped.
+
+        Parameters:
+            port (str): Serial port to which the sensor is connected.
+        """
+        # pySerial implements the TIOCGSERIAL/TIOCSSERIAL ioctl pair on Linux only
+        set_low_latency_mode = getattr(self.ser, "set_low_latency_mode", None)
+        if set_low_latency_mode is not None:
+            try:
+                set_low_latency_mode(True)
+            except (NotImplementedError, ValueError, OSError):
+                pass  # Unsupported platform or driver
+        # Only available, and only meaningful, on Windows
+        set_buffer_size = getattr(self.ser, "set_buffer_size", None)
+        if set_buffer_size is not None:
+            set_buffer_size(rx_size=65536, tx_size=4096)
+
+        # The sysfs attribute exists only for FTDI devices and usually needs write access
+        tty = os.path.basename(os.path.realpath(port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError:
+            pass  # Not an FTDI adapter, not Linux, or no permission
 
     def _send_command(
         self,
@@ -55,6 +256,7 @@ class PS1XXXXMOD:
         wait_time: float = 0,
         add_checksum: bool = True,
         ignore_error: bool = True,
+        terminator: Optional[bytes] = None,
     ) -> Union[bytes, bool]:
         """
         Sends a command to the sensor and handles the reception of the response.
@@ -64,11 +266,12 @@ class PS1XXXXMOD:
             needed_response (bool, optional): Indicates if a response from the sensor is required. Default is True.
             attempts (int, optional): Number of attempts to send the command. Default is 3.
             response_size (int, optional): Expected size of the response in bytes. Default is 9.
-            read_timeout (float, optional): Specific timeout for reading the response.
+            read_timeout (float, optional): Specific timeout for reading the response. Default is `self.timeout`.
             write_timeout (float, optional): Specific timeout for writing the command.
-            wait_time (float, optional): Wait time after sending the command. Default is 0.
+            wait_time (float, optional): Extra time allowed for the response, on the first attempt only. Default is 0.
             add_checksum (bool, optional): Indicates whether to add a checksum to the command. Default is True.
             ignore_error (bool, optional): Indicates whether to ignore errors. Default is True.
+            terminator (bytes, optional): Bytes ending the response; reading stops as soon as they arrive.
 
         Returns:
             bytes: The response received from the sensor if `needed_response` is True.
@@ -80,47 +283,132 @@ class PS1XXXXMOD:
         """
         if write_timeout is not None:
             if write_timeout > 0:
-                self.ser.timeout = write_timeout
+                self.ser.write_timeout = write_timeout
             else:
                 if not ignore_error:
-                    raise self.InvalidValue("Write timeout must be greater than 0")
+                    raise InvalidValue("Write timeout must be greater than 0")
 
         if add_checksum:
-            command += self._convert_to_bytes(self._calculate_checksum(command))
+            command = bytearray(command)
+            command.append(self._calculate_checksum(command))
 
-        for _ in range(attempts):
+        for attempt in range(attempts):
+            # Drop stale bytes, such as a reply that arrived after the previous deadline
             self._clean()
             self.ser.write(command)
 
             if needed_response:
-                if wait_time:
+                wait_budget = 0.0
+                if wait_time and not attempt:
                     if wait_time > 0:
-                        time.sleep(wait_time)
+                        wait_budget = wait_time
                     else:
                         if not ignore_error:
-                            raise self.InvalidValue("Wait time must be greater than 0")
+                            raise InvalidValue("Wait time must be greater than 0")
+                read_budget = self._response_budget()
                 if read_timeout is not None:
                     if read_timeout > 0:
-                        self.ser.timeout = read_timeout
+                        read_budget = read_timeout
                     else:
                         if not ignore_error:
-                            raise self.InvalidValue(
+                            raise InvalidValue(
                                 "Read timeout must be greater than 0"
                             )
-                response = self.ser.read(response_size)
-                if response:
+                # A single deadline covers both the wait time and the read timeout,
+                # so the response is consumed as soon as it arrives instead of after a sleep
+                response = self._read_exactly(
+                    response_size,
+                    deadline=time.monotonic() + wait_budget + read_budget,
+                    terminator=terminator,
+                )
+                if len(response) == response_size or (
+                    terminator and response.endswith(terminator)
+                ):
                     return response
+                if attempt + 1 < attempts:
+                    # Exponential backoff with jitter, so a busy sensor is not hammered
+                    backoff = min(self.max_backoff, self.backoff_base * 2**attempt)
+                    time.sleep(backoff * random.uniform(0.5, 1.5))
             else:
                 return True
 
         if not ignore_error:
-            raise self.NoResponse("Response not received")
+            raise NoResponse("Response not received")
+
+    def _response_budget(self) -> float:
+        """
+        Returns the time allowed for a response, in seconds.
+
+        Returns:
+            float: `self.timeout`, or infinity if it is None.
+        """
+        return math.inf if self.timeout is None else self.timeout
+
+    def _read_exactly(
+        self, n: int, deadline: float, terminator: Optional[bytes] = None
+    ) -> bytes:
+        """
+        Reads exactly `n` bytes from the serial port, unless the deadline expires first.
+
+        A single `read` may return fewer bytes than requested before its timeout elapses
+        (e.g. on Linux or Bluetooth links), so reading continues until the frame is whole.
+
+        Parameters:
+            n (int): Number of bytes to read.
+            deadline (float): `time.monotonic()` value after which reading stops.
+            terminator (bytes, optional): Bytes that end the frame early when received.
+
+        Returns:
+            bytes: The bytes read, fewer than `n` if the deadline expired or the terminator was received.
+        """
+        # Bound once: the loop runs once per chunk received
+        monotonic = time.monotonic
+        read = self._read_chunk
+
+        # Always a sized read: pySerial's `read_until` reads one byte per call
+        buf = bytearray()
+        while len(buf) < n and monotonic() < deadline:
+            buf += read(n - len(buf))
+            if terminator is not None and buf.endswith(terminator):
+                break
+        return bytes(buf)
+
+    def _read_chunk(self, size: int) -> bytes:
+        """
+        Reads up to `size` bytes, waiting at most one read slice for data to arrive.
+
+        Parameters:
+            size (int): Maximum number of bytes to read.
+
+        Returns:
+            bytes: The bytes read, possibly empty.
+
+        Raises:
+            serial.SerialException: If the port is readable but returns no data (e.g. unplugged).
+        """
+        if self._fd is None:
+            return self.ser.read(size)
+        ready, _, _ = select.select([self._fd], [], [], self.ser.timeout)
+        if not ready:
+            return b""
+        try:
+            data = os.read(self._fd, size)
+        except BlockingIOError:
+            return b""
+        if not data:
+            # End of file on a readable descriptor: the tty was hung up, as pySerial reports
+            raise serial.SerialException(
+                "device reports readiness to read but returned no data "
+                "(device disconnected or multiple access on port?)"
+            )
+        return data
 
     def _clean(self) -> None:
         """
-        Cleans the input buffer of the serial port.
+        Cleans the input buffer of the serial port, if it holds any data.
         """
-        self.ser.reset_input_buffer()
+        if self.ser.in_waiting:
+            self.ser.reset_input_buffer()
 
     def _convert_to_bytes(self, input_data: Union[int, str, bytes]) -> bytes:
         """
@@ -145,11 +433,13 @@ class PS1XXXXMOD:
             return input_data.to_bytes(byte_length, byteorder="big")
 
         elif isinstance(input_data, str):
-            # Check if it's a hexadecimal string (all characters are hexadecimal)
-            try:
-                return bytes.fromhex(input_data)
-            except ValueError:
-                pass  # Continue if it's not a valid hexadecimal string
+            # Check if it's a hexadecimal string (all characters are hexadecimal).
+            # The cheap character check avoids raising an exception for plain text.
+            if not input_data.strip(_HEX_CHARACTERS):
+                try:
+                    return bytes.fromhex(input_data)
+                except ValueError:
+                    pass  # Continue if it's not a valid hexadecimal string
 
             # Check if it's a binary string (must start with '0b')
             if input_data.startswith("0b"):
@@ -192,35 +482,17 @@ class PS1XXXXMOD:
         if not isinstance(payload, (bytes, int)):
             raise TypeError("Payload must be of type int or bytes.")
 
-        command_bytes = self._convert_to_bytes(command)
-        payload_bytes = self._convert_to_bytes(payload)
+        # Single-byte fast path; anything else goes through the generic conversion
+        if isinstance(command, int) and 0 <= command <= 0xFF:
+            command_bytes = bytes((command,))
+        else:
+            command_bytes = self._convert_to_bytes(command)
+        if isinstance(payload, int) and 0 <= payload <= 0xFF:
+            payload_bytes = bytes((payload,))
+        else:
+            payload_bytes = self._convert_to_bytes(payload)
         return b"\xFF\x01" + command_bytes + payload_bytes + b"\x00\x00\x00\x00"
 
-    def _byte_to_bin_array(self, byte: int) -> list[int]:
-        """
-        Converts a byte into a list of bits.
-
-        Parameters:
-            byte (int): Byte to convert.
-
-        Returns:
-            list[int]: List of bits (0 or 1) representing the byte.
-        """
-        bit_string = bin(byte)[2:].zfill(8)
-        return [int(b) for b in bit_string]
-
-    def _extract_range(self, bytes_data: bytes) -> int:
-        """
-        Extracts the maximum range from the first two bytes.
-
-        Parameters:
-            bytes_data (bytes): Byte sequence from which to extract the range.
-
-        Returns:
-            int: Extracted maximum range.
-        """
-        return (bytes_data[0] << 8) | bytes_data[1]
-
     def _parse_unit(self, byte: int) -> Optional[tuple[str, str]]:
         """
         Interprets the unit byte.
@@ -231,14 +503,7 @@ class PS1XXXXMOD:
         Returns:
             tuple[str, str] | None: Measurement unit as a tuple or None if unrecognized.
         """
-        if byte == 0x02:
-            return "ppm", "mg/m³"
-        elif byte == 0x04:
-            return "ppb", "µg/m³"
-        elif byte == 0x08:
-            return "10g/m³", "%"
-        else:
-            return None
+        return _UNIT_TABLE.get(byte)
 
     def _extract_decimal_places(self, byte: int) -> int:
         """
@@ -250,14 +515,7 @@ class PS1XXXXMOD:
         Returns:
             int: Number of decimal places.
         """
-        bit_array = self._byte_to_bin_array(byte)
-        bit_array.reverse()
-        return (
-            (bit_array[7] << 3)
-            | (bit_array[6] << 2)
-            | (bit_array[5] << 1)
-            | bit_array[4]
-        )
+        return (byte >> 4) & 0x0F  # High nibble
 
     def _extract_data_sign(self, byte: int) -> int:
         """
@@ -269,50 +527,7 @@ class PS1XXXXMOD:
         Returns:
             int: Data sign (0 for positive, 1 for negative).
         """
-        bit_array = self._byte_to_bin_array(byte)
-        bit_array.reverse()
-        return (
-            (bit_array[3] << 3)
-            | (bit_array[2] << 2)
-            | (bit_array[1] << 1)
-            | bit_array[0]
-        )
-
-    def _extract_gas_concentration(self, bytes_data: bytes) -> int:
-        """
-        Extracts gas concentration from the specified two bytes.
-
-        Parameters:
-            bytes_data (bytes): Two bytes representing gas concentration.
-
-        Returns:
-            int: Extracted gas concentration.
-        """
-        return (bytes_data[0] << 8) + bytes_data[1]
-
-    def _extract_temp(self, bytes_data: bytes) -> float:
-        """
-        Extracts temperature from the specified two bytes.
-
-        Parameters:
-            bytes_data (bytes): Two bytes representing temperature.
-
-        Returns:
-            float: Extracted temperature, divided by 100.
-        """
-        return float((bytes_data[0] << 8) | bytes_data[1]) / 100
-
-    def _extract_hum(self, bytes_data: bytes) -> float:
-        """
-        Extracts humidity from the specified two bytes.
-
-        Parameters:
-            bytes_data (bytes): Two bytes representing humidity.
-
-        Returns:
-            float: Extracted humidity, divided by 100.
-        """
-        return float((bytes_data[0] << 8) | bytes_data[1]) / 100
+        return byte & 0x0F  # Low nibble
 
     def set_active_upload(self) -> None:
         """
@@ -320,13 +535,8 @@ class PS1XXXXMOD:
 
         This method sends a command to the sensor to start active data upload.
         """
-        self._clean()
-
-        command = b"\x78"
-        payload = b"\x40"
         self._send_command(
-            self._generate_command_byte_string(command=command, payload=payload),
-            needed_response=False,
+            self._CMD_SET_ACTIVE, needed_response=False, add_checksum=False
         )
 
     def set_passive_upload(self) -> None:
@@ -335,13 +545,8 @@ class PS1XXXXMOD:
 
         This method sends a command to the sensor to set passive data upload.
         """
-        self._clean()
-
-        command = b"\x78"
-        payload = b"\x41"
         self._send_command(
-            self._generate_command_byte_string(command=command, payload=payload),
-            needed_response=False,
+            self._CMD_SET_PASSIVE, needed_response=False, add_checksum=False
         )
 
     def get_sensor_info(self) -> Optional[Dict[str, Any]]:
@@ -355,20 +560,16 @@ class PS1XXXXMOD:
             dict | None: Dictionary containing sensor information or None if the response is invalid.
 
         Raises:
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
         command = b"\xD1"
         response = self._send_command(command, add_checksum=False)
         if response and len(response) == 9:
-            if not self._check_response_checksum(response=response):
-                raise self.InvalidChecksum(
-                    f"Checksum mismatch, response: {str(response)}"
-                )
-            sensor_type = response[0]
-            max_range = self._extract_range(response[1:3])
-            unit = response[3]
-            decimal_places = self._extract_decimal_places(response[7])
-            data_sign = self._extract_data_sign(response[7])
+            if not self._verify_checksum(response):
+                return None
+            sensor_type, max_range, unit, format_byte, _ = _SENSOR_INFO.unpack(response)
+            decimal_places = self._extract_decimal_places(format_byte)
+            data_sign = self._extract_data_sign(format_byte)
             return {
                 "sensor_type": sensor_type,
                 "maximum_range": max_range,
@@ -391,20 +592,18 @@ class PS1XXXXMOD:
             dict | None: Dictionary containing sensor information or None if the response is invalid.
 
         Raises:
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
         command = b"\xD7"
         response = self._send_command(command, add_checksum=False)
         if response and len(response) == 9:
-            if not self._check_response_checksum(response=response):
-                raise self.InvalidChecksum(
-                    f"Checksum mismatch, response: {str(response)}"
-                )
-            sensor_type = response[2]
-            max_range = self._extract_range(response[3:5])
-            unit = response[5]
-            decimal_places = self._extract_decimal_places(response[6])
-            data_sign = self._extract_data_sign(response[6])
+            if not self._verify_checksum(response):
+                return None
+            sensor_type, max_range, unit, format_byte, _ = _SENSOR_INFO_2.unpack(
+                response
+            )
+            decimal_places = self._extract_decimal_places(format_byte)
+            data_sign = self._extract_data_sign(format_byte)
             return {
                 "sensor_type": sensor_type,
                 "maximum_range": max_range,
@@ -415,6 +614,15 @@ class PS1XXXXMOD:
             }
         return None
 
+    def invalidate_sensor_info_cache(self) -> None:
+        """
+        Discards the sensor information cached by `gas_concentration` and `read_all`.
+
+        The unit is fetched once and reused afterwards; call this method if the sensor
+        connected to the port is replaced.
+        """
+        self._sensor_info_cache = None
+
     def gas_concentration(self, include_unit: bool = True) -> Optional[Dict[str, Any]]:
         """
         Retrieves the gas concentration measured by the sensor.
@@ -426,22 +634,20 @@ class PS1XXXXMOD:
             dict | None: Dictionary with gas concentrations and their respective units or only numerical values.
 
         Raises:
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
-        command = b"\x86"
         response = self._send_command(
-            self._generate_command_byte_string(command=command)
+            self._CMD_GAS_CONCENTRATION, add_checksum=False
         )
         if response and len(response) == 9:
-            if not self._check_response_checksum(response=response):
-                raise self.InvalidChecksum(
-                    f"Checksum mismatch, response: {str(response)}"
-                )
-            gas_concentration_1 = self._extract_gas_concentration(response[2:4])
-            full_range = self._extract_range(response[4:6])
-            gas_concentration_2 = self._extract_gas_concentration(response[6:8])
+            if not self._verify_checksum(response):
+                return None
+            _, _, gas_concentration_1, full_range, gas_concentration_2, _ = (
+                _FRAME9.unpack(response)
+            )
             if include_unit:
-                sensor_info = self.get_sensor_info()
+                sensor_info = self._sensor_info_cache or self.get_sensor_info()
+                self._sensor_info_cache = sensor_info
                 if sensor_info and sensor_info["unit"]:
                     return {
                         "gas_concentration_1": gas_concentration_1,
@@ -469,24 +675,29 @@ class PS1XXXXMOD:
             dict | None: Dictionary with all measurements or None if the response is invalid.
 
         Raises:
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
-        command = b"\x87"
         response = self._send_command(
-            self._generate_command_byte_string(command=command), response_size=13
+            self._CMD_READ_ALL, response_size=13, add_checksum=False
         )
         if response and len(response) == 13:
-            if not self._check_response_checksum(response=response):
-                raise self.InvalidChecksum(
-                    f"Checksum mismatch, response: {str(response)}"
-                )
-            gas_concentration_1 = self._extract_gas_concentration(response[2:4])
-            full_range = self._extract_range(response[4:6])
-            gas_concentration_2 = self._extract_gas_concentration(response[6:8])
-            temperature = self._extract_temp(response[8:10])
-            humidity = self._extract_hum(response[10:12])
+            if not self._verify_checksum(response):
+                return None
+            (
+                _,
+                _,
+                gas_concentration_1,
+                full_range,
+                gas_concentration_2,
+                temperature_raw,
+                humidity_raw,
+                _,
+            ) = _FRAME13.unpack(response)
+            temperature = temperature_raw / 100
+            humidity = humidity_raw / 100
             if include_unit:
-                sensor_info = self.get_sensor_info()
+                sensor_info = self._sensor_info_cache or self.get_sensor_info()
+                self._sensor_info_cache = sensor_info
                 if sensor_info and sensor_info["unit"]:
                     return {
                         "gas_concentration_1": gas_concentration_1,
@@ -539,7 +750,7 @@ class PS1XXXXMOD:
 
         Raises:
             NotImplementedError: If the command to obtain calibrated temperature and humidity is not implemented.
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
         # TODO: Implement the correct command to obtain calibrated temperature and humidity
         raise NotImplementedError(
@@ -554,11 +765,13 @@ class PS1XXXXMOD:
             bool | None: True if the command was successfully executed, False otherwise, None if the response is invalid.
         """
         response = self._send_command(
-            b"\xAF\x53\x6C\x65\x65\x70", response_size=2, add_checksum=False
+            b"\xAF\x53\x6C\x65\x65\x70",
+            response_size=2,
+            add_checksum=False,
+            terminator=b"k",
         )
         if response and len(response) == 2:
-            response_decoded = response.decode("utf-8").strip().lower()
-            return response_decoded == "ok"
+            return response.lower() == b"ok"
         return None
 
     def exit_sleep_mode(self, wait_for_restore: bool = False) -> Optional[bool]:
@@ -572,13 +785,15 @@ class PS1XXXXMOD:
             bool | None: True if the command was successfully executed, False otherwise, None if the response is invalid.
         """
         response = self._send_command(
-            b"\xAE\x45\x78\x69\x74", response_size=2, add_checksum=False
+            b"\xAE\x45\x78\x69\x74",
+            response_size=2,
+            add_checksum=False,
+            terminator=b"k",
         )
         if wait_for_restore:
             time.sleep(5)  # Wait 5 seconds for restoration
         if response and len(response) == 2:
-            response_decoded = response.decode("utf-8").strip().lower()
-            return response_decoded == "ok"
+            return response.lower() == b"ok"
         return None
 
     def enter_sleep_mode_2(self) -> bool:
@@ -586,20 +801,17 @@ class PS1XXXXMOD:
         Puts the sensor into sleep mode using an alternative command.
 
         Returns:
-            bool: True if the command was successfully executed, False otherwise.
+            bool: True if the command was successfully executed, False otherwise
+                (including a response with an invalid checksum).
 
         Raises:
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
         response = self._send_command(
             b"\xA1\x53\x6C\x65\x65\x70\x32", add_checksum=False
         )
         if response and len(response) == 9:
-            if not self._check_response_checksum(response=response):
-                raise self.InvalidChecksum(
-                    f"Checksum mismatch, response: {str(response)}"
-                )
-            return True
+            return self._verify_checksum(response)
         return False
 
     def exit_sleep_mode_2(self, wait_for_restore: bool = False) -> bool:
@@ -610,20 +822,17 @@ class PS1XXXXMOD:
             wait_for_restore (bool, optional): Indicates whether to wait for restoration after exiting sleep mode. Default is False.
 
         Returns:
-            bool: True if the command was successfully executed, False otherwise.
+            bool: True if the command was successfully executed, False otherwise
+                (including a response with an invalid checksum).
 
         Raises:
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
         response = self._send_command(b"\xA2\x45\x78\x69\x74\x32", add_checksum=False)
         if wait_for_restore:
             time.sleep(5)  # Wait 5 seconds for restoration
         if response and len(response) == 9:
-            if not self._check_response_checksum(response=response):
-                raise self.InvalidChecksum(
-                    f"Checksum mismatch, response: {str(response)}"
-                )
-            return True
+            return self._verify_checksum(response)
         return False
 
     def turn_off_light(self) -> Optional[bool]:
@@ -633,14 +842,11 @@ class PS1XXXXMOD:
         Returns:
             bool | None: True if the command was successfully executed, False otherwise, None if the response is invalid.
         """
-        command = b"\x88"
         response = self._send_command(
-            self._generate_command_byte_string(command=command),
-            response_size=2,
+            self._CMD_LIGHT_OFF, response_size=2, add_checksum=False, terminator=b"k"
         )
         if response and len(response) == 2:
-            response_decoded = response.decode("utf-8").strip().lower()
-            return response_decoded == "ok"
+            return response.lower() == b"ok"
         return None
 
     def turn_on_light(self) -> Optional[bool]:
@@ -650,14 +856,11 @@ class PS1XXXXMOD:
         Returns:
             bool | None: True if the command was successfully executed, False otherwise, None if the response is invalid.
         """
-        command = b"\x89"
         response = self._send_command(
-            self._generate_command_byte_string(command=command),
-            response_size=2,
+            self._CMD_LIGHT_ON, response_size=2, add_checksum=False, terminator=b"k"
         )
         if response and len(response) == 2:
-            response_decoded = response.decode("utf-8").strip().lower()
-            return response_decoded == "ok"
+            return response.lower() == b"ok"
         return None
 
     def query_light_status(self) -> Optional[bool]:
@@ -668,15 +871,12 @@ class PS1XXXXMOD:
             bool | None: True if the light is on, False if it is off, None if the response is invalid.
 
         Raises:
-            InvalidChecksum: If the response checksum is invalid.
+            InvalidChecksum: If the response checksum is invalid and `strict_checksum` is set.
         """
-        command = b"\x8A"
-        response = self._send_command(
-            self._generate_command_byte_string(command=command),
-        )
+        response = self._send_command(self._CMD_LIGHT_STATUS, add_checksum=False)
         if response and len(response) == 9:
-            if not self._check_response_checksum(response=response):
-                raise self.InvalidChecksum("Checksum mismatch")
+            if not self._verify_checksum(response):
+                return None
             return response[2] == 0x01  # 1: on, 0: off
         return None
 
@@ -684,31 +884,242 @@ class PS1XXXXMOD:
         """
         Actively reads gas concentrations if data is available.
 
+        The data is resynchronized on the 0xFF start byte like the stream reader: a
+        candidate frame whose checksum does not match is skipped one byte at a time, so a
+        read that started inside a frame does not shift every later read. A call that had
+        to resynchronize counts one error in `checksum_errors`.
+
         Returns:
             dict | None: Dictionary with gas concentrations or None if no valid data is available.
 
         Raises:
-            InvalidChecksum: If the checksum of the read data is invalid.
+            InvalidChecksum: If the checksum of the read data is invalid and `strict_checksum` is set;
+                raised once the reader is realigned, so that later calls are not affected.
         """
-        if self.ser.in_waiting:
-            read = self.ser.read(9)
-            if read and len(read) == 9:
-                if not self._check_response_checksum(response=read):
-                    raise self.InvalidChecksum(f"Checksum mismatch, read: {str(read)}")
-                gas_concentration_1 = self._extract_gas_concentration(read[2:4])
-                full_range = self._extract_range(read[4:6])
-                gas_concentration_2 = self._extract_gas_concentration(read[6:8])
-                return {
-                    "gas_concentration_1": gas_concentration_1,
-                    "full_range": full_range,
-                    "gas_concentration_2": gas_concentration_2,
-                }
+        if not self.ser.in_waiting:
+            return None
+        # Frames follow each other every upload period, well within `self.timeout`
+        deadline = time.monotonic() + self._response_budget()
+        checksum_diff = self._checksum_diff
+
+        buf = bytearray()
+        failed = None
+        while True:
+            start = buf.find(0xFF)
+            if start < 0:
+                buf.clear()
+            else:
+                del buf[:start]
+            # Only the missing tail of the candidate frame is read, with one sized read
+            missing = 9 - len(buf)
+            if missing > 0:
+                read = self._read_exactly(missing, deadline=deadline)
+                buf += read
+                if len(read) < missing:
+                    break
+                continue
+            frame = bytes(buf)
+            if checksum_diff(frame):
+                failed = failed or frame
+                del buf[:1]
+                continue
+            if failed is not None:
+                self._checksum_error(failed, label="read")
+            return self._parse_upload_frame(frame)
+        if failed is not None:
+            self._checksum_error(failed, label="read")
         return None
 
+    def _parse_upload_frame(self, frame: bytes) -> Dict[str, int]:
+        """
+        Extracts the gas concentrations from a 9-byte frame sent in active upload mode.
+
+        Parameters:
+            frame (bytes): Frame whose checksum has already been verified.
+
+        Returns:
+            dict: Dictionary with gas concentrations and full range.
+        """
+        _, _, gas_concentration_1, full_range, gas_concentration_2, _ = _FRAME9.unpack(
+            frame
+        )
+        return {
+            "gas_concentration_1": gas_concentration_1,
+            "full_range": full_range,
+            "gas_concentration_2": gas_concentration_2,
+        }
+
+    def start_stream(self, maxsize: int = 64) -> None:
+        """
+        Starts a background thread that collects the frames sent in active upload mode.
+
+        Frames are validated and parsed as soon as they arrive, then stored in a bounded
+        queue; when the queue is full, the oldest frame is dropped. The thread owns the
+        serial input while it runs, so no other command should be sent until `stop_stream`.
+        A thread that died on an error (e.g. the port was closed) is replaced.
+
+        Parameters:
+            maxsize (int, optional): Maximum number of frames kept in the queue. Default is 64.
+        """
+        if self._stream_thread is not None and self._stream_thread.is_alive():
+            return
+        self._stream_queue = queue.Queue(maxsize=maxsize)
+        self._stream_stop.clear()
+        self._stream_error = None
+        self._stream_thread = threading.Thread(target=self._run_reader, daemon=True)
+        self._stream_thread.start()
+
+    def stop_stream(self) -> None:
+        """
+        Stops the background thread started by `start_stream`.
+
+        Frames already queued remain available to `read_latest` and `read_iter`.
+        """
+        if self._stream_thread is None:
+            return
+        self._stream_stop.set()
+        self._stream_thread.join()
+        self._stream_thread = None
+
+    def _run_reader(self) -> None:
+        """
+        Runs `_reader_loop`, keeping the exception that ends it for the consumer.
+        """
+        try:
+            self._reader_loop()
+        except Exception as e:  # e.g. serial.SerialException when the port disappears
+            self._stream_error = e
+
+    def _raise_stream_error(self) -> None:
+        """
+        Re-raises the exception that stopped the reader thread, if any.
+
+        Raises:
+            Exception: The exception raised by the reader thread.
+        """
+        if self._stream_error is not None:
+            raise self._stream_error
+
+    def _reader_loop(self) -> None:
+        """
+        Drains the serial port into the stream queue until `stop_stream` is called.
+
+        The byte stream is resynchronized on the 0xFF start byte: a candidate frame
+        whose checksum does not match is skipped one byte at a time. Each loss of sync
+        counts as one error in `checksum_errors`; the false starts found while
+        resynchronizing, and the initial synchronization, are not counted.
+        """
+        # Bound once: the loop runs for as long as the stream does
+        ser = self.ser
+        stopped = self._stream_stop.is_set
+        read_chunk = self._read_chunk
+        checksum_diff = self._checksum_diff
+        parse = self._parse_upload_frame
+        put = self._put_stream_frame
+
+        buf = bytearray()
+        in_sync = False
+        while not stopped():
+            buf += read_chunk(ser.in_waiting or 1)
+            while True:
+                start = buf.find(0xFF)
+                if start < 0:
+                    buf.clear()
+                    break
+                if len(buf) - start < 9:
+                    del buf[:start]
+                    break
+                frame = bytes(buf[start : start + 9])
+                if checksum_diff(frame):
+                    self.checksum_errors += in_sync
+                    in_sync = False
+                    del buf[: start + 1]
+                    continue
+                in_sync = True
+                del buf[: start + 9]
+                put(parse(frame))
+
+    def _put_stream_frame(self, parsed: Dict[str, int]) -> None:
+        """
+        Adds a parsed frame to the stream queue, dropping the oldest one if it is full.
+
+        Parameters:
+            parsed (dict): Parsed frame to add.
+        """
+        try:
+            self._stream_queue.put_nowait(parsed)
+        except queue.Full:
+            try:
+                self._stream_queue.get_nowait()
+            except queue.Empty:
+                pass  # Emptied by a consumer in the meantime
+            self._stream_queue.put_nowait(parsed)
+
+    def read_latest(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the most recent streamed frame, discarding the older ones.
+
+        Returns:
+            dict | None: Dictionary with gas concentrations or None if no frame was received.
+
+        Raises:
+            RuntimeError: If the stream was never started.
+            Exception: The error that stopped the reader thread (e.g. serial.SerialException),
+                once no frame is left.
+        """
+        if self._stream_queue is None:
+            raise RuntimeError("The stream must be started with start_stream().")
+        latest = None
+        while True:
+            try:
+                latest = self._stream_queue.get_nowait()
+            except queue.Empty:
+                if latest is None:
+                    self._raise_stream_error()
+                return latest
+
+    def read_iter(self, timeout: Optional[float] = None) -> Iterator[Dict[str, int]]:
+        """
+        Yields the streamed frames in order of arrival.
+
+        Iteration ends once the stream is stopped and the queue is empty, or when no
+        frame arrives within `timeout` seconds. If the reader thread stopped on an error,
+        that error is raised once the queued frames have been yielded.
+
+        Parameters:
+            timeout (float, optional): Maximum wait for each frame. Default is None (wait indefinitely).
+
+        Yields:
+            dict: Dictionary with gas concentrations.
+
+        Raises:
+            RuntimeError: If the stream was never started.
+            Exception: The error that stopped the reader thread (e.g. serial.SerialException
+                when the port is closed).
+        """
+        if self._stream_queue is None:
+            raise RuntimeError("The stream must be started with start_stream().")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            thread = self._stream_thread
+            if (thread is None or not thread.is_alive()) and self._stream_queue.empty():
+                break
+            try:
+                parsed = self._stream_queue.get(timeout=self._READ_SLICE)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+                continue
+            yield parsed
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
+        self._raise_stream_error()
+
     def close(self) -> None:
         """
-        Closes the serial connection with the sensor.
+        Closes the serial connection with the sensor, stopping the stream if running.
         """
+        self.stop_stream()
         self.ser.close()
 
     def _calculate_checksum(
@@ -721,6 +1132,8 @@ class PS1XXXXMOD:
         2. Inverts each bit of the result to obtain an 8-bit value.
         3. Adds 1 to the final result.
 
+        Steps 2 and 3 are the two's complement of the sum, so they are computed as a single negation.
+
         Parameters:
             data (bytes): A sequence of bytes from which to calculate the checksum.
             include_first (bool, optional): If True, includes the first byte in the calculations. Default is False.
@@ -749,16 +1162,8 @@ class PS1XXXXMOD:
         else:
             end = data_length + length if length < 0 else data_length
 
-        # Step 1: Sum the specified bytes in the range
-        checksum = sum(data[start:end]) & 0xFF  # Take only the last 8 bits of the sum
-
-        # Step 2: Invert each bit
-        checksum = ~checksum & 0xFF  # Invert and limit to 8 bits
-
-        # Step 3: Add 1 to the result
-        checksum = (checksum + 1) & 0xFF  # Add 1 and limit to 8 bits
-
-        return checksum
+        # Sum the specified bytes, then invert and add 1 (i.e. negate), limited to 8 bits
+        return -sum(data[start:end]) & 0xFF
 
     def _check_response_checksum(
         self, response: bytes, include_first: bool = False
@@ -780,50 +1185,174 @@ class PS1XXXXMOD:
             raise ValueError(
                 "The response must contain at least 1 byte to verify the checksum."
             )
+        return not self._checksum_diff(response, include_first=include_first)
 
-        # Extract the checksum from the response
-        checksum_received = response[-1]
+    def _verify_checksum(self, response: bytes, label: str = "response") -> bool:
+        """
+        Verifies the checksum of a response and counts it in `checksum_errors` if invalid.
 
-        # Calculate the checksum of the response, excluding the last byte (checksum)
-        calculated_checksum = self._calculate_checksum(
-            response[:-1], include_first=include_first
-        )
+        A bad frame is common on a noisy line, so it is reported through the return value
+        rather than an exception unless `strict_checksum` is set.
 
-        # Check if the calculated checksum matches the received checksum
-        return calculated_checksum == checksum_received
+        Parameters:
+            response (bytes): The sequence of bytes received from the sensor, including the checksum.
+            label (str, optional): Name of the data in the error message. Default is "response".
 
-    def to_hex(self, int_value: int) -> str:
+        Returns:
+            bool: True if the checksum is valid, False otherwise.
+
+        Raises:
+            InvalidChecksum: If the checksum is invalid and `strict_checksum` is set.
         """
-        Converts an integer value to a hexadecimal string.
+        if self._check_response_checksum(response=response):
+            return True
+        self._checksum_error(response, label=label)
+        return False
+
+    def _checksum_error(self, response: bytes, label: str = "response") -> None:
+        """
+        Counts a response with an invalid checksum in `checksum_errors`.
 
         Parameters:
-            int_value (int): Integer value to convert.
+            response (bytes): The sequence of bytes received from the sensor, including the checksum.
+            label (str, optional): Name of the data in the error message. Default is "response".
+
+        Raises:
+            InvalidChecksum: If `strict_checksum` is set.
+        """
+        self.checksum_errors += 1
+        if self.strict_checksum:
+            raise InvalidChecksum(
+                f"Checksum mismatch, {label}: {self.frame_to_hex(response)}"
+            )
+
+    def _checksum_diff(self, response: bytes, include_first: bool = False) -> int:
+        """
+        Computes how far the checksum of a response is from the expected one.
+
+        The result is 0 for a valid frame and non-zero otherwise, so it can be
+        accumulated directly (e.g. `errors += bool(diff)`) without branching on a bool.
+
+        Parameters:
+            response (bytes): The sequence of bytes received from the sensor, including the checksum.
+            include_first (bool, optional): If True, includes the first byte in the checksum calculation. Default is False.
 
         Returns:
-            str: Hexadecimal representation of the value.
+            int: 8-bit difference between the received and the calculated checksum.
         """
-        return "{:02X}".format(int_value)
+        # The checksum is the negated sum of the preceding bytes, so a valid frame
+        # sums to 0 (mod 256) once the checksum byte itself is included
+        start = 0 if include_first else 1
+        return sum(response[start:]) & 0xFF
 
-    class InvalidValue(Exception):
+    @staticmethod
+    def _frames_array(frames: bytes, frame_size: int = 9) -> "np.ndarray":
         """
-        Exception raised when an invalid value is provided.
+        Views a capture of concatenated frames as an (N, frame_size) array of bytes.
+
+        Parameters:
+            frames (bytes): Concatenated frames.
+            frame_size (int, optional): Size of each frame in bytes. Default is 9.
+
+        Returns:
+            numpy.ndarray: Array of dtype uint8, sharing memory with `frames`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the length of `frames` is not a multiple of `frame_size`.
         """
+        np = _import_numpy()
+        if len(frames) % frame_size:
+            raise ValueError(
+                f"The capture length must be a multiple of {frame_size} bytes."
+            )
+        return np.frombuffer(frames, dtype=np.uint8).reshape(-1, frame_size)
 
-        pass
+    @staticmethod
+    def check_many(frames: bytes, frame_size: int = 9) -> "np.ndarray":
+        """
+        Verifies the checksums of many frames at once, e.g. a capture of uploads.
 
-    class InvalidChecksum(Exception):
+        Requires NumPy. The sums run in NumPy's C loops, which pays off on large
+        captures but not on single frames, hence `_check_response_checksum` stays pure
+        Python.
+
+        Parameters:
+            frames (bytes): Concatenated frames.
+            frame_size (int, optional): Size of each frame in bytes, e.g. 13 for `read_all` replies. Default is 9.
+
+        Returns:
+            numpy.ndarray: Boolean array, True for each frame whose checksum is valid.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the length of `frames` is not a multiple of `frame_size`.
         """
-        Exception raised when the response checksum does not match.
+        np = _import_numpy()
+        arr = PS1XXXXMOD._frames_array(frames, frame_size)
+        # A valid frame sums to 0 (mod 256) from the second byte to the checksum included
+        return (arr[:, 1:].sum(axis=1, dtype=np.uint16) & 0xFF) == 0
+
+    @staticmethod
+    def parse_many(frames: bytes) -> Dict[str, "np.ndarray"]:
+        """
+        Parses many 9-byte gas concentration frames at once into one array per field.
+
+        Requires NumPy.
+
+        Parameters:
+            frames (bytes): Concatenated frames.
+
+        Returns:
+            dict: Arrays "gas_concentration_1", "full_range" and "gas_concentration_2",
+                plus the boolean array "valid" from `check_many`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the length of `frames` is not a multiple of 9.
+        """
+        np = _import_numpy()
+        arr = PS1XXXXMOD._frames_array(frames)
+        # Decode the three big-endian 16-bit fields of every frame in a single view,
+        # the batch counterpart of `_FRAME9`
+        fields = np.ascontiguousarray(arr[:, 2:8]).view(">u2").astype(np.uint16)
+        return {
+            "gas_concentration_1": fields[:, 0],
+            "full_range": fields[:, 1],
+            "gas_concentration_2": fields[:, 2],
+            "valid": PS1XXXXMOD.check_many(frames),
+        }
+
+    def to_hex(self, int_value: int) -> str:
         """
+        Converts an integer value to a hexadecimal string.
 
-        pass
+        Parameters:
+            int_value (int): Integer value to convert.
 
-    class NoResponse(Exception):
+        Returns:
+            str: Hexadecimal representation of the value.
         """
-        Exception raised when no response is received from the sensor.
+        if 0 <= int_value <= 0xFF:
+            return _HEX[int_value]
+        return "{:02X}".format(int_value)
+
+    def frame_to_hex(self, data: Union[bytes, bytearray]) -> str:
+        """
+        Converts a frame to a string of space-separated hexadecimal bytes.
+
+        Parameters:
+            data (bytes, bytearray): Frame to convert.
+
+        Returns:
+            str: Hexadecimal representation of the frame, e.g. "FF 86 00 2A".
         """
+        return _frame_to_hex(bytes(data))
 
-        pass
+    # Kept as class attributes for compatibility (e.g. `except PS1XXXXMOD.NoResponse`)
+    InvalidValue = InvalidValue
+    InvalidChecksum = InvalidChecksum
+    NoResponse = NoResponse
 
 
 if __name__ == "__main__":
@@ -833,14 +1362,26 @@ if __name__ == "__main__":
         sensor.set_passive_upload()
 
         print("Starting data read from the sensor...")
-        while True:
+        # read_all() returns as soon as its 13-byte reply arrives (about 14 ms at 9600
+        # baud); the loop then waits only for the rest of the 1 s period, measured on the
+        # monotonic clock, so the reading rate does not drift with the command time.
+        # See `start_stream` to receive every frame pushed in active upload mode instead.
+        period = 1.0
+        next_reading = time.monotonic()
+        for count in itertools.count(1):
             data = sensor.read_all()
-            if data:
-                print(data)
-            time.sleep(1)  # Wait one second between readings
+            if data is None:
+                # Bad checksums are counted instead of raised (see `strict_checksum`)
+                errors = sensor.checksum_errors
+                sys.stdout.write(f"No valid reading ({errors} checksum errors so far)\n")
+            else:
+                sys.stdout.write(f"{data}\n")
+            if count % 10 == 0:
+                sys.stdout.flush()  # Flush every 10 readings rather than on each one
+            # After a slow, retried command, restart the schedule instead of catching up
+            next_reading = max(next_reading + period, time.monotonic())
+            time.sleep(max(0.0, next_reading - time.monotonic()))
 
-    except PS1XXXXMOD.InvalidChecksum as e:
-        print(f"Checksum error: {e}")
     except PS1XXXXMOD.NoResponse as e:
         print(f"No response from sensor: {e}")
     except PS1XXXXMOD.InvalidValue as e:
@@ -23,6 +23,9 @@ setup(
     install_requires=[
         "pyserial>=3.6",
     ],
+    extras_require={
+        "numpy": ["numpy"],  # Batch validation and parsing of captured frames
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: Apache 2.0 License",